@@ -0,0 +1,17 @@
+# Generated by Django 2.2.21 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contentcards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contentcard',
+            index=models.Index(fields=['page_name', 'locale'], name='contentcard_page_locale_idx'),
+        ),
+    ]
@@ -30,14 +30,48 @@ def get_data_from_file_path(file_path):
     }
 
 
+def get_card_data(card_data):
+    """Return a dict appropriate for calling the card() macro"""
+    data = {}
+    data.update(card_data)
+    if 'image' in data:
+        data['image_url'] = '%scontentcards/img/%s' % (settings.CONTENT_CARDS_URL,
+                                                       data['image'])
+        del data['image']
+
+    if 'highres_image' in data:
+        data['highres_image_url'] = '%scontentcards/img/%s' % (settings.CONTENT_CARDS_URL,
+                                                               data['highres_image'])
+        del data['highres_image']
+
+    if 'ga_title' not in data:
+        data['ga_title'] = data['title']
+
+    if 'media_icon' in data:
+        data['media_icon'] = 'mzp-has-%s' % data['media_icon']
+
+    if 'aspect_ratio' in data:
+        data['aspect_ratio'] = 'mzp-has-aspect-%s' % data['aspect_ratio']
+
+    if 'size' in data:
+        data['class'] = 'mzp-c-card-%s' % data['size']
+        del data['size']
+
+    if 'link_url' in data and not URL_RE.match(data['link_url']):
+        data['link_url'] = reverse(data['link_url'])
+
+    return data
+
+
 class ContentCardManager(models.Manager):
     def get_card(self, page_name, name, locale='en-US'):
         card_id = '{}-{}-{}'.format(page_name, locale, name)
         return self.get(id=card_id)
 
     def get_page_cards(self, page_name, locale='en-US'):
-        cards = self.filter(page_name=page_name, locale=locale)
-        return {c.card_name: c.card_data for c in cards}
+        # no need for full model instances, only the name and data are used
+        cards = self.filter(page_name=page_name, locale=locale).values_list('card_name', 'data')
+        return {name: get_card_data(data) for name, data in cards}
 
     def refresh(self):
         card_objs = []
@@ -75,6 +109,10 @@ class ContentCard(models.Model):
 
     class Meta:
         ordering = ('id',)
+        indexes = [
+            # matches the lookup in ContentCardManager.get_page_cards
+            models.Index(fields=['page_name', 'locale'], name='contentcard_page_locale_idx'),
+        ]
 
     def __str__(self):
         return '{} ({})'.format(self.card_name, self.locale)
@@ -86,32 +124,4 @@ class ContentCard(models.Model):
     @property
     def card_data(self):
         """Return a dict appropriate for calling the card() macro"""
-        data = {}
-        data.update(self.data)
-        if 'image' in data:
-            data['image_url'] = '%scontentcards/img/%s' % (settings.CONTENT_CARDS_URL,
-                                                           data['image'])
-            del data['image']
-
-        if 'highres_image' in data:
-            data['highres_image_url'] = '%scontentcards/img/%s' % (settings.CONTENT_CARDS_URL,
-                                                                   data['highres_image'])
-            del data['highres_image']
-
-        if 'ga_title' not in data:
-            data['ga_title'] = data['title']
-
-        if 'media_icon' in data:
-            data['media_icon'] = 'mzp-has-%s' % data['media_icon']
-
-        if 'aspect_ratio' in data:
-            data['aspect_ratio'] = 'mzp-has-aspect-%s' % data['aspect_ratio']
-
-        if 'size' in data:
-            data['class'] = 'mzp-c-card-%s' % data['size']
-            del data['size']
-
-        if 'link_url' in data and not URL_RE.match(data['link_url']):
-            data['link_url'] = reverse(data['link_url'])
-
-        return data
+        return get_card_data(self.data)
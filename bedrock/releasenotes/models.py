@@ -1,8 +1,11 @@
 import codecs
 import json
 import os
+import re
+from functools import lru_cache
 from glob import glob
 from operator import attrgetter
+from threading import local
 
 from django.conf import settings
 from django.core.cache import caches
@@ -11,8 +14,8 @@ from django.http import Http404
 from django.utils.dateparse import parse_datetime
 from django.utils.functional import cached_property
 
-import bleach
 import markdown
+from bleach.sanitizer import Cleaner
 from django_extensions.db.fields.json import JSONField
 from product_details.version_compare import Version
 
@@ -30,7 +33,7 @@ markdowner = markdown.Markdown(extensions=[
     'markdown.extensions.nl2br',
 ])
 # based on bleach.sanitizer.ALLOWED_TAGS
-ALLOWED_TAGS = [
+ALLOWED_TAGS = frozenset([
     'a',
     'abbr',
     'acronym',
@@ -46,11 +49,30 @@ ALLOWED_TAGS = [
     'strike',
     'strong',
     'ul',
-]
+])
+# bleach only changes text containing markup, entities or control characters
+NEEDS_CLEANING_RE = re.compile('[<>&\x00-\x08\x0b-\x1f\ud800-\udfff]')
+# bleach Cleaners are not thread-safe so keep one per thread
+_local = local()
+
+
+def get_cleaner():
+    """Return the HTML Cleaner for the current thread."""
+    cleaner = getattr(_local, 'cleaner', None)
+    if cleaner is None:
+        cleaner = _local.cleaner = Cleaner(tags=ALLOWED_TAGS)
 
+    return cleaner
 
+
+# notes are converted again each time a release is loaded from the DB
+@lru_cache(maxsize=2048)
 def process_markdown(value):
-    return markdowner.reset().convert(bleach.clean(value, tags=ALLOWED_TAGS))
+    # skip the HTML parser for plain text that bleach would return unchanged
+    if NEEDS_CLEANING_RE.search(value):
+        value = get_cleaner().clean(value)
+
+    return markdowner.reset().convert(value)
 
 
 def process_notes(notes):
@@ -111,6 +111,25 @@ class TestReleaseModel(TestCase):
         assert len(rel.notes) == 6
 
 
+class TestProcessMarkdown(TestCase):
+    @patch.object(models, 'get_cleaner')
+    def test_plain_text_skips_cleaner(self, cleaner_mock):
+        assert models.process_markdown('The *Dude* abides') == '<p>The <em>Dude</em> abides</p>'
+        assert not cleaner_mock.called
+
+    def test_html_is_cleaned(self):
+        assert models.process_markdown('<script>dude</script>') == '<p>&lt;script&gt;dude&lt;/script&gt;</p>'
+        assert models.process_markdown('Walter & <b>Donny</b>') == '<p>Walter &amp; <b>Donny</b></p>'
+
+    @patch.object(models, 'markdowner')
+    def test_results_are_cached(self, md_mock):
+        models.process_markdown.cache_clear()
+        self.addCleanup(models.process_markdown.cache_clear)
+        models.process_markdown('The Dude abides')
+        models.process_markdown('The Dude abides')
+        assert md_mock.reset.return_value.convert.call_count == 1
+
+
 @patch.object(models.ProductRelease, 'objects')
 class TestGetRelease(TestCase):
     def setUp(self):
@@ -1,20 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
 
 import requests
 from sentry_sdk import capture_exception
 
 
-def _request(api_url, limit=None, page=1):
+# max number of pages to fetch from WP at once
+MAX_PAGE_WORKERS = 4
+# share connections to the WP hosts between requests
+session = requests.Session()
+
+
+def _request(api_url, limit=None, page=1, params=None):
     # 100 is max per page from WP
     per_page = limit or 100
-    resp = requests.get(api_url, params={'per_page': per_page, 'page': page}, timeout=5)
+    req_params = {'per_page': per_page, 'page': page}
+    if params:
+        req_params.update(params)
+    resp = session.get(api_url, params=req_params, timeout=5)
     resp.raise_for_status()
     data = resp.json()
     if limit is None and page == 1:
         num_pages = int(resp.headers.get('x-wp-totalpages', 1))
         if num_pages > 1:
-            for i in range(2, num_pages + 1):
-                data.extend(_request(api_url, page=i))
+            with ThreadPoolExecutor(max_workers=min(num_pages - 1, MAX_PAGE_WORKERS)) as executor:
+                pages = executor.map(lambda i: _request(api_url, page=i, params=params),
+                                     range(2, num_pages + 1))
+                for page_data in pages:
+                    data.extend(page_data)
 
     return data
 
@@ -26,7 +40,7 @@ def _api_url(feed_url, data_type, data_id):
     return api_url
 
 
-def get_wp_data(feed_id, data_type, data_id=None, limit=None):
+def get_wp_data(feed_id, data_type, data_id=None, limit=None, params=None):
     try:
         feed_config = settings.WP_BLOGS[feed_id]
         if data_type == 'posts' and limit is None:
@@ -34,6 +48,8 @@ def get_wp_data(feed_id, data_type, data_id=None, limit=None):
         api_url = _api_url(feed_config['url'], data_type, data_id)
         if data_id:
             data = _request(api_url, limit=1)
+        elif params:
+            data = _request(api_url, limit=limit, params=params)
         else:
             data = _request(api_url, limit=limit)
 
@@ -54,9 +70,10 @@ def get_posts_data(feed_id, num_posts=None):
 def complete_posts_data(blog_slug, posts):
     # posts will be a list of tuples (db obj or None, post data dict)
     tags = get_feed_tags(blog_slug)
+    media = get_posts_media(blog_slug, [post for _, post in posts])
     for _, post in posts:
         post['tags'] = [tags[t] for t in post['tags']]
-        update_post_media(blog_slug, post)
+        update_post_media(post, media)
 
 
 def get_feed_tags(feed_id):
@@ -64,15 +81,25 @@ def get_feed_tags(feed_id):
     return {t['id']: t['slug'] for t in tags}
 
 
-def update_post_media(feed_id, post):
+def get_posts_media(feed_id, posts):
+    """Fetch the featured media for all posts in a single request
+
+    Returns a dict of media ID to media info.
+    """
+    media_ids = sorted({post['featured_media'] for post in posts if post.get('featured_media')})
+    if not media_ids:
+        return {}
+
+    media = get_wp_data(feed_id, 'media', params={'include': ','.join(str(m) for m in media_ids)})
+    if not media:
+        return {}
+
+    return {m['id']: m for m in media}
+
+
+def update_post_media(post, media):
     """Fill out posts with featured media info"""
     # some blogs set featured_media to 0 when none is set
     if 'featured_media' in post:
-        if post['featured_media']:
-            media = get_wp_data(feed_id, 'media', post['featured_media'])
-            if media:
-                post['featured_media'] = media
-                return
-
-        # blank featured_media value if anything went wrong
-        post['featured_media'] = {}
+        # blank featured_media value if it is unset or wasn't returned
+        post['featured_media'] = media.get(post['featured_media'], {})
@@ -4,7 +4,7 @@ import operator
 import random
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.db.utils import DatabaseError
 from django.utils.dateparse import parse_datetime
@@ -81,42 +81,46 @@ class BlogPostManager(models.Manager):
         return self.get_queryset().filter_by_tags(*tags)
 
     def update_posts(self, blog_slug, posts):
-        update_count = 0
         del_count = 0
-        post_ids = []
+        post_ids = [post['id'] for post in posts]
         posts_to_update = []
+        existing_posts = self.filter_by_blogs(blog_slug).filter(wp_id__in=post_ids)
+        existing_posts = {obj.wp_id: obj for obj in existing_posts}
         for post in posts:
-            modified = make_datetime(post['modified_gmt'])
-            post_ids.append(post['id'])
-            try:
-                obj = self.get(wp_id=post['id'], wp_blog_slug=blog_slug)
-            except BlogPost.DoesNotExist:
+            obj = existing_posts.get(post['id'])
+            if obj is None:
                 posts_to_update.append((None, post))
-            else:
-                if obj.modified != modified:
-                    posts_to_update.append((obj, post))
+            elif obj.modified != make_datetime(post['modified_gmt']):
+                posts_to_update.append((obj, post))
 
         if not posts_to_update:
             return 0, 0
 
         complete_posts_data(blog_slug, posts_to_update)
+        new_objs = []
+        changed_objs = []
         for obj, post in posts_to_update:
             post = post_to_dict(blog_slug, post)
             if not post:
                 continue
 
-            try:
-                if obj:
-                    for key, value in post.items():
-                        setattr(obj, key, value)
-                    obj.save()
-                else:
-                    self.create(**post)
-            except DatabaseError:
-                capture_exception()
-                raise
-
-            update_count += 1
+            if obj:
+                for key, value in post.items():
+                    setattr(obj, key, value)
+                changed_objs.append(obj)
+            else:
+                new_objs.append(BlogPost(**post))
+
+        try:
+            with transaction.atomic(using=self.db):
+                self.bulk_create(new_objs)
+                self.bulk_update(changed_objs, [f.name for f in self.model._meta.concrete_fields
+                                                if not f.primary_key])
+        except DatabaseError:
+            capture_exception()
+            raise
+
+        update_count = len(new_objs) + len(changed_objs)
 
         # clean up after changes
         if update_count:
@@ -15,7 +15,7 @@ TEST_WP_BLOGS = {
 }
 
 
-@patch.object(api, 'requests')
+@patch.object(api, 'session')
 def test_limited_request(req_mock):
     api._request('some_url', limit=10)
     req_mock.get.assert_called_once_with('some_url',
@@ -70,3 +70,18 @@ def test_get_wp_data(req_mock):
     api.get_wp_data('firefox', 'tags')
     api_url = api._api_url(TEST_WP_BLOGS['firefox']['url'], 'tags', None)
     req_mock.assert_called_with(api_url, limit=None)
+
+
+@patch.object(api, 'get_wp_data')
+def test_get_posts_media(wp_mock):
+    wp_mock.return_value = [{'id': 75, 'source_url': 'dude.png'}]
+    posts = [{'featured_media': 75}, {'featured_media': 0}, {'featured_media': 42}, {}]
+    media = api.get_posts_media('firefox', posts)
+    wp_mock.assert_called_once_with('firefox', 'media', params={'include': '42,75'})
+    assert media == {75: {'id': 75, 'source_url': 'dude.png'}}
+
+
+@patch.object(api, 'get_wp_data')
+def test_get_posts_media_no_media(wp_mock):
+    assert api.get_posts_media('firefox', [{'featured_media': 0}]) == {}
+    assert not wp_mock.called
@@ -30,12 +30,11 @@ def get_test_file_content(filename):
 def setup_responses(blog='firefox'):
     posts_url = api._api_url(TEST_WP_BLOGS[blog]['url'], 'posts', None)
     tags_url = api._api_url(TEST_WP_BLOGS[blog]['url'], 'tags', None)
-    media_url = api._api_url(TEST_WP_BLOGS[blog]['url'], 'media', 75)
-    media_url_404 = api._api_url(TEST_WP_BLOGS[blog]['url'], 'media', 42)
+    media_url = api._api_url(TEST_WP_BLOGS[blog]['url'], 'media', None)
     responses.add(responses.GET, posts_url, body=get_test_file_content('posts.json'))
     responses.add(responses.GET, tags_url, body=get_test_file_content('tags.json'))
-    responses.add(responses.GET, media_url, body=get_test_file_content('media_75.json'))
-    responses.add(responses.GET, media_url_404, status=404)
+    # media 42 is missing from the response
+    responses.add(responses.GET, media_url, body='[{}]'.format(get_test_file_content('media_75.json')))
 
 
 @responses.activate
@@ -44,14 +43,16 @@ def test_get_posts_data():
     setup_responses()
     posts = api.get_posts_data('firefox')
     tags = api.get_feed_tags('firefox')
+    media = api.get_posts_media('firefox', posts)
     for post in posts:
         post['tags'] = [tags[t] for t in post['tags']]
-        api.update_post_media('firefox', post)
+        api.update_post_media(post, media)
     assert posts[0]['tags'] == ['browser', 'fastest']
     assert posts[0]['featured_media'] == {}
     assert posts[1]['featured_media'] == {}
     assert posts[2]['featured_media']['id'] == 75
-    assert len(responses.calls) == 4
+    assert len(responses.calls) == 3
+    assert 'include=42%2C75' in responses.calls[2].request.url
 
 
 @responses.activate
@@ -110,3 +111,19 @@ def test_featured_tag():
     p = blog.filter_by_tags('browser', 'jank')[0]
     assert p.get_featured_tag(['browser', 'jank', 'dude']) in ['browser', 'jank']
     assert p.get_featured_tag(['dude']) == ''
+
+
+@responses.activate
+@override_settings(WP_BLOGS=TEST_WP_BLOGS)
+@pytest.mark.django_db
+def test_refresh_posts_updates_modified():
+    setup_responses()
+    models.BlogPost.objects.refresh('firefox')
+    bp = models.BlogPost.objects.get(wp_id=10)
+    title = bp.title
+    bp.title = 'The Dude Abides'
+    bp.modified = models.make_datetime('2010-01-01T00:00:00')
+    bp.save()
+    assert models.BlogPost.objects.refresh('firefox') == (1, 0)
+    assert models.BlogPost.objects.get(wp_id=10).title == title
+    assert models.BlogPost.objects.count() == 3